@@ -167,7 +167,8 @@ Return ONLY the JSON, no other text."""
             difficulty = 'hard'
         
         # Use spatial engine to calculate proper positions
-        platform_configs = SpatialEngine.calculate_obby_platforms(num_platforms, difficulty)
+        platform_layout = SpatialEngine.calculate_obby_platforms_soa(num_platforms, difficulty)
+        platform_configs = SpatialEngine.platforms_aos(platform_layout)
         
         tasks = []
         
@@ -200,9 +201,8 @@ Return ONLY the JSON, no other text."""
         })
         
         # Task 3: Create spawn location on first platform
-        first_platform_cframe = platform_configs[0]['properties']['CFrame']
-        first_platform_size = platform_configs[0]['properties']['Size']
-        spawn_cframe = SpatialEngine.get_spawn_location(first_platform_cframe, first_platform_size)
+        first_x, first_y, first_z = platform_layout['positions'][0]
+        spawn_cframe = SpatialEngine.spawn_above(first_x, first_y, first_z, platform_layout['size'][1])
         
         tasks.append({
             'type': 'create_object_with_properties',
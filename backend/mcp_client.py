@@ -1,167 +1,147 @@
+import asyncio
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # not a declared dependency; used only if already installed
+except ImportError:
+    orjson = None
+
+# (connect, read) timeouts: keep connect tight so a dead bridge fails fast
+DEFAULT_TIMEOUT = (2.0, 10.0)
+BULK_TIMEOUT = (2.0, 30.0)
+HEALTH_TIMEOUT = (1.0, 2.0)
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+def _dumps(payload):
+    """Serialize a request payload to compact UTF-8 JSON bytes for the MCP wire"""
+    if orjson is not None:
+        # stdlib json accepts int/float/bool/None dict keys; keep orjson from rejecting them
+        body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        # orjson writes NaN/Infinity as null; any null goes through stdlib so those still raise
+        if b'null' not in body:
+            return body
+    # allow_nan=False matches requests' json= handling: non-finite floats raise, never hit the wire
+    return json.dumps(payload, separators=(',', ':'), allow_nan=False).encode('utf-8')
 
 class MCPClient:
     def __init__(self, base_url='http://localhost:3002'):
         self.base_url = base_url
         self.connected = False
         self.headers = {'ngrok-skip-browser-warning': 'true'}
+        
+        # One keep-alive pool for every call; sized for AsyncMCPClient fan-out
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=AsyncMCPClient.MAX_CONCURRENCY)
+        self._local = threading.local()
+    
+    @property
+    def session(self):
+        """This thread's requests.Session; every thread's session shares the one pooled adapter"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            session.mount('http://', self._adapter)
+            session.mount('https://', self._adapter)
+            self._local.session = session
+        return session
     
     def check_connection(self):
         try:
-            response = requests.get(f"{self.base_url}/health", headers=self.headers, timeout=2)
+            response = self.session.get(f"{self.base_url}/health", timeout=HEALTH_TIMEOUT)
             self.connected = response.status_code == 200
             return self.connected
         except:
             self.connected = False
             return False
     
+    def _post(self, endpoint, payload, timeout=DEFAULT_TIMEOUT):
+        response = self.session.post(
+            f"{self.base_url}/mcp/{endpoint}",
+            data=_dumps(payload),
+            headers=_JSON_HEADERS,
+            timeout=timeout
+        )
+        response.raise_for_status()
+        return response.json()
+    
     # File System Tools
     def get_file_tree(self):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_file_tree",
-                json={},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_file_tree', {}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to get file tree: {str(e)}', 'tree': []}
     
     def search_files(self, query, file_type=None):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/search_files",
-                json={'query': query, 'file_type': file_type},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('search_files', {'query': query, 'file_type': file_type})
         except Exception as e:
             return {'error': f'Failed to search files: {str(e)}'}
     
     # Studio Context Tools
     def get_place_info(self):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_place_info",
-                json={},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_place_info', {})
         except Exception as e:
             return {'error': f'Failed to get place info: {str(e)}'}
     
     def get_services(self):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_services",
-                json={},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_services', {})
         except Exception as e:
             return {'error': f'Failed to get services: {str(e)}'}
     
     def search_objects(self, query, search_type='name'):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/search_objects",
-                json={'query': query, 'search_type': search_type},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('search_objects', {'query': query, 'search_type': search_type})
         except Exception as e:
             return {'error': f'Failed to search objects: {str(e)}'}
     
     # Instance & Property Tools
     def get_instance_properties(self, path):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_instance_properties",
-                json={'path': path},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_instance_properties', {'path': path})
         except Exception as e:
             return {'error': f'Failed to get instance properties: {str(e)}'}
     
     def get_instance_children(self, path):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_instance_children",
-                json={'path': path},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_instance_children', {'path': path})
         except Exception as e:
             return {'error': f'Failed to get instance children: {str(e)}'}
     
     def search_by_property(self, property_name, property_value):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/search_by_property",
-                json={'property_name': property_name, 'property_value': property_value},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('search_by_property', {'property_name': property_name, 'property_value': property_value})
         except Exception as e:
             return {'error': f'Failed to search by property: {str(e)}'}
     
     def get_class_info(self, class_name):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_class_info",
-                json={'class_name': class_name},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_class_info', {'class_name': class_name})
         except Exception as e:
             return {'error': f'Failed to get class info: {str(e)}'}
     
     # Property Modification Tools
     def set_property(self, path, property_name, property_value):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/set_property",
-                json={'path': path, 'property_name': property_name, 'property_value': property_value},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('set_property', {'path': path, 'property_name': property_name, 'property_value': property_value})
         except Exception as e:
             return {'error': f'Failed to set property: {str(e)}'}
     
     def mass_set_property(self, paths, property_name, property_value):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/mass_set_property",
-                json={'paths': paths, 'property_name': property_name, 'property_value': property_value},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('mass_set_property', {'paths': paths, 'property_name': property_name, 'property_value': property_value}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to mass set property: {str(e)}'}
     
     def mass_get_property(self, paths, property_name):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/mass_get_property",
-                json={'paths': paths, 'property_name': property_name},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('mass_get_property', {'paths': paths, 'property_name': property_name}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to mass get property: {str(e)}'}
     
@@ -172,13 +152,7 @@ class MCPClient:
             if name:
                 payload['name'] = name
             
-            response = requests.post(
-                f"{self.base_url}/mcp/create_object",
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('create_object', payload)
         except Exception as e:
             return {'error': f'Failed to create object: {str(e)}'}
     
@@ -193,25 +167,13 @@ class MCPClient:
             if properties:
                 payload['properties'] = properties
             
-            response = requests.post(
-                f"{self.base_url}/mcp/create_object_with_properties",
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('create_object_with_properties', payload)
         except Exception as e:
             return {'error': f'Failed to create object with properties: {str(e)}'}
     
     def mass_create_objects(self, objects_data):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/mass_create_objects",
-                json={'objects': objects_data},
-                timeout=60
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('mass_create_objects', {'objects': objects_data}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to mass create objects: {str(e)}'}
     
@@ -226,38 +188,20 @@ class MCPClient:
                 print(f"    CFrame: {obj.get('properties', {}).get('CFrame', 'N/A')}")
             print(f"=== END DEBUG ===\n")
             
-            response = requests.post(
-                f"{self.base_url}/mcp/mass_create_objects_with_properties",
-                json={'objects': objects_data},
-                timeout=60
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('mass_create_objects_with_properties', {'objects': objects_data}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to mass create objects with properties: {str(e)}'}
     
     def delete_object(self, path):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/delete_object",
-                json={'path': path},
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('delete_object', {'path': path})
         except Exception as e:
             return {'error': f'Failed to delete object: {str(e)}'}
     
     # Project Analysis Tools
     def get_project_structure(self, depth=5):
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_project_structure",
-                json={'depth': depth},
-                timeout=30
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_project_structure', {'depth': depth}, timeout=BULK_TIMEOUT)
         except Exception as e:
             return {'error': f'Failed to get project structure: {str(e)}'}
     
@@ -265,28 +209,14 @@ class MCPClient:
     def get_script_source(self, instance_path):
         """Get the source code of a script"""
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/get_script_source",
-                json={'instancePath': instance_path},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('get_script_source', {'instancePath': instance_path})
         except Exception as e:
             return {'error': f'Failed to get script source: {str(e)}'}
     
     def set_script_source(self, instance_path, source):
         """Set the source code of a script"""
         try:
-            response = requests.post(
-                f"{self.base_url}/mcp/set_script_source",
-                json={'instancePath': instance_path, 'source': source},
-                headers=self.headers,
-                timeout=10
-            )
-            response.raise_for_status()
-            return response.json()
+            return self._post('set_script_source', {'instancePath': instance_path, 'source': source})
         except Exception as e:
             return {'error': f'Failed to set script source: {str(e)}'}
     
@@ -353,3 +283,37 @@ class MCPClient:
             return tool_map[tool_name](params)
         else:
             return {'error': f'Unknown tool: {tool_name}'}
+    
+    def gather(self, calls):
+        """Run independent (tool_name, params) calls concurrently, results in call order"""
+        async_client = AsyncMCPClient(self)
+        try:
+            return asyncio.run(async_client.gather(calls))
+        finally:
+            async_client.close()
+
+
+class AsyncMCPClient:
+    """Asyncio front-end over MCPClient for fanning out independent tool calls"""
+    
+    MAX_CONCURRENCY = 16
+    
+    def __init__(self, client):
+        self.client = client
+        # Bulkhead: a burst of calls must not exhaust the MCP bridge
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        # Own workers: the loop's default executor (min(32, cpus + 4)) would cap fan-out below this
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENCY, thread_name_prefix='mcp')
+    
+    async def call_tool(self, tool_name, params):
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.client.call_tool, tool_name, params)
+    
+    async def gather(self, calls):
+        return await asyncio.gather(*(self.call_tool(name, params) for name, params in calls))
+    
+    def close(self):
+        """Release the worker threads; pending calls still finish"""
+        self._executor.shutdown(wait=False)
+
@@ -1,3 +1,7 @@
+import re
+from string import Template
+from types import MappingProxyType
+
 ROBLOX_SYSTEM_PROMPT = """You are RoboVibeCode, an expert autonomous AI agent specialized in Roblox Studio development and Lua scripting.
 
 CORE CAPABILITIES:
@@ -61,29 +65,31 @@ CODE STYLE:
 
 Always provide complete, working solutions that can be directly implemented in Roblox Studio."""
 
+_SYSTEM_PROMPT_BYTES = ROBLOX_SYSTEM_PROMPT.encode('utf-8')
+
 ROBLOX_CODE_TEMPLATES = {
-    'remote_event_server': '''local ReplicatedStorage = game:GetService("ReplicatedStorage")
-local {event_name} = ReplicatedStorage:WaitForChild("{event_name}")
+    'remote_event_server': Template('''local ReplicatedStorage = game:GetService("ReplicatedStorage")
+local $event_name = ReplicatedStorage:WaitForChild("$event_name")
 
-{event_name}.OnServerEvent:Connect(function(player, ...)
+$event_name.OnServerEvent:Connect(function(player, ...)
     -- Server-side handling
     print(player.Name .. " triggered event")
-end)''',
+end)'''),
     
-    'remote_event_client': '''local ReplicatedStorage = game:GetService("ReplicatedStorage")
-local {event_name} = ReplicatedStorage:WaitForChild("{event_name}")
+    'remote_event_client': Template('''local ReplicatedStorage = game:GetService("ReplicatedStorage")
+local $event_name = ReplicatedStorage:WaitForChild("$event_name")
 
-{event_name}:FireServer(data)''',
+$event_name:FireServer(data)'''),
     
-    'datastore_save': '''local DataStoreService = game:GetService("DataStoreService")
-local {store_name} = DataStoreService:GetDataStore("{store_name}")
+    'datastore_save': Template('''local DataStoreService = game:GetService("DataStoreService")
+local $store_name = DataStoreService:GetDataStore("$store_name")
 
 local function SaveData(player)
     local success, result = pcall(function()
         local data = {
             -- Add player data here
         }
-        {store_name}:SetAsync(player.UserId, data)
+        $store_name:SetAsync(player.UserId, data)
     end)
     
     if not success then
@@ -91,28 +97,28 @@ local function SaveData(player)
     end
 end
 
-game.Players.PlayerRemoving:Connect(SaveData)''',
+game.Players.PlayerRemoving:Connect(SaveData)'''),
     
-    'leaderstats': '''game.Players.PlayerAdded:Connect(function(player)
+    'leaderstats': Template('''game.Players.PlayerAdded:Connect(function(player)
     local leaderstats = Instance.new("Folder")
     leaderstats.Name = "leaderstats"
     leaderstats.Parent = player
     
-    local {stat_name} = Instance.new("IntValue")
-    {stat_name}.Name = "{stat_display_name}"
-    {stat_name}.Value = 0
-    {stat_name}.Parent = leaderstats
-end)''',
+    local $stat_name = Instance.new("IntValue")
+    $stat_name.Name = "$stat_display_name"
+    $stat_name.Value = 0
+    $stat_name.Parent = leaderstats
+end)'''),
     
-    'module_script': '''local {module_name} = {}
+    'module_script': Template('''local $module_name = {}
 
-function {module_name}.{function_name}(...)
+function $module_name.$function_name(...)
     -- Implementation
 end
 
-return {module_name}''',
+return $module_name'''),
     
-    'checkpoint_system': '''-- Checkpoint System for Obby Games
+    'checkpoint_system': Template('''-- Checkpoint System for Obby Games
 local Players = game:GetService("Players")
 local checkpoints = workspace:WaitForChild("Checkpoints"):GetChildren()
 
@@ -156,9 +162,9 @@ for i, checkpoint in ipairs(checkpoints) do
             checkpoint.Material = Enum.Material.Neon
         end
     end)
-end''',
+end'''),
     
-    'tween_service_movement': '''local TweenService = game:GetService("TweenService")
+    'tween_service_movement': Template('''local TweenService = game:GetService("TweenService")
 
 local function MovePart(part, targetCFrame, duration)
     local tweenInfo = TweenInfo.new(
@@ -174,9 +180,9 @@ local function MovePart(part, targetCFrame, duration)
 end
 
 -- Example usage:
--- MovePart(workspace.MovingPlatform, CFrame.new(0, 10, 0), 2)''',
+-- MovePart(workspace.MovingPlatform, CFrame.new(0, 10, 0), 2)'''),
     
-    'kill_brick': '''-- Kill brick that respawns player
+    'kill_brick': Template('''-- Kill brick that respawns player
 local killBrick = script.Parent
 
 killBrick.Touched:Connect(function(hit)
@@ -184,7 +190,13 @@ killBrick.Touched:Connect(function(hit)
     if humanoid then
         humanoid.Health = 0
     end
-end)''',
+end)'''),
+}
+
+# Raw template text in the original {placeholder} form, returned when no kwargs are given
+_TEMPLATE_SOURCES = {
+    name: re.sub(r'\$(\w+)', r'{\1}', template.template)
+    for name, template in ROBLOX_CODE_TEMPLATES.items()
 }
 
 # Property templates for common objects with correct types
@@ -246,6 +258,49 @@ ROBLOX_PROPERTY_TEMPLATES = {
     }
 }
 
+# Suggested folder/script layout per game genre; read-only since every caller shares it
+_STRUCTURES = MappingProxyType({
+    'obby': MappingProxyType({
+        'description': 'Obstacle course game with checkpoints and levels',
+        'folders': (
+            'ReplicatedStorage/Checkpoints',
+            'ReplicatedStorage/RemoteEvents',
+            'ServerScriptService/CheckpointManager',
+            'StarterGui/ObbyUI',
+        ),
+        'scripts': (
+            ('ServerScriptService/CheckpointManager', 'Script'),
+            ('StarterPlayer/StarterPlayerScripts/ClientController', 'LocalScript'),
+        )
+    }),
+    'tycoon': MappingProxyType({
+        'description': 'Tycoon game with money, buttons, and upgrades',
+        'folders': (
+            'ReplicatedStorage/TycoonData',
+            'ServerScriptService/TycoonManager',
+            'ServerScriptService/DataManager',
+        ),
+        'scripts': (
+            ('ServerScriptService/TycoonManager/MainController', 'Script'),
+            ('ServerScriptService/DataManager/SaveSystem', 'Script'),
+        )
+    }),
+    'rpg': MappingProxyType({
+        'description': 'RPG with inventory, quests, and combat',
+        'folders': (
+            'ReplicatedStorage/GameData',
+            'ReplicatedStorage/RemoteEvents',
+            'ServerScriptService/CombatSystem',
+            'ServerScriptService/InventorySystem',
+            'ServerScriptService/QuestSystem',
+        ),
+        'scripts': (
+            ('ReplicatedStorage/GameData/ItemDatabase', 'ModuleScript'),
+            ('ServerScriptService/CombatSystem/DamageHandler', 'Script'),
+        )
+    })
+})
+
 def get_property_template(object_type, template_name='default'):
     """Get property template for an object type"""
     if object_type in ROBLOX_PROPERTY_TEMPLATES:
@@ -256,56 +311,20 @@ def get_property_template(object_type, template_name='default'):
 def get_roblox_context():
     return ROBLOX_SYSTEM_PROMPT
 
+def get_roblox_context_bytes():
+    """UTF-8 encoded system prompt, for consumers writing raw request bodies"""
+    return _SYSTEM_PROMPT_BYTES
+
 def get_template(template_name, **kwargs):
     if template_name in ROBLOX_CODE_TEMPLATES:
         template = ROBLOX_CODE_TEMPLATES[template_name]
-        # Only format if kwargs are provided, otherwise return as-is
+        # Only substitute if kwargs are provided, otherwise return as-is
         if kwargs:
-            return template.format(**kwargs)
-        return template
+            return template.substitute(kwargs)
+        return _TEMPLATE_SOURCES[template_name]
     return None
 
 def generate_roblox_structure_suggestion(game_type):
-    structures = {
-        'obby': {
-            'description': 'Obstacle course game with checkpoints and levels',
-            'folders': [
-                'ReplicatedStorage/Checkpoints',
-                'ReplicatedStorage/RemoteEvents',
-                'ServerScriptService/CheckpointManager',
-                'StarterGui/ObbyUI',
-            ],
-            'scripts': [
-                ('ServerScriptService/CheckpointManager', 'Script'),
-                ('StarterPlayer/StarterPlayerScripts/ClientController', 'LocalScript'),
-            ]
-        },
-        'tycoon': {
-            'description': 'Tycoon game with money, buttons, and upgrades',
-            'folders': [
-                'ReplicatedStorage/TycoonData',
-                'ServerScriptService/TycoonManager',
-                'ServerScriptService/DataManager',
-            ],
-            'scripts': [
-                ('ServerScriptService/TycoonManager/MainController', 'Script'),
-                ('ServerScriptService/DataManager/SaveSystem', 'Script'),
-            ]
-        },
-        'rpg': {
-            'description': 'RPG with inventory, quests, and combat',
-            'folders': [
-                'ReplicatedStorage/GameData',
-                'ReplicatedStorage/RemoteEvents',
-                'ServerScriptService/CombatSystem',
-                'ServerScriptService/InventorySystem',
-                'ServerScriptService/QuestSystem',
-            ],
-            'scripts': [
-                ('ReplicatedStorage/GameData/ItemDatabase', 'ModuleScript'),
-                ('ServerScriptService/CombatSystem/DamageHandler', 'Script'),
-            ]
-        }
-    }
-    
-    return structures.get(game_type.lower(), None)
+    """Suggested layout for a game genre as a fresh plain dict, or None if unknown"""
+    structure = _STRUCTURES.get(game_type.lower())
+    return dict(structure) if structure is not None else None
@@ -1,3 +1,48 @@
+import re
+
+_SIZE_RE = re.compile(r'size\s+(\d+)\s*[,x]?\s*(\d+)\s*[,x]?\s*(\d+)')
+_POS_RE = re.compile(r'(?:position|pos|at)\s+(-?\d+)\s*[,]?\s*(-?\d+)\s*[,]?\s*(-?\d+)')
+_COLOR_RE = re.compile(r'color\s+([a-z]+)')
+_NAME_RE = re.compile(r'(?:named|called)\s+["\']?([^"\']+)["\']?')
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Python bool -> Lua literal
+_BOOL_LUA = {True: 'true', False: 'false'}
+
+def _lua_anchored(value):
+    """Lua literal for an 'anchored' option; non-bools render as before via str().lower()"""
+    return _BOOL_LUA[value] if type(value) is bool else str(value).lower()
+
+def _lua_vector3(value):
+    return 'Vector3.new(' + ', '.join(map(str, value)) + ')'
+
+# Exact Python type -> Lua literal formatter; type() dispatch keeps bool apart from int
+_LUA_FMT = {
+    str: lambda value: f'"{value}"',
+    bool: _BOOL_LUA.__getitem__,
+    int: str,
+    float: str,
+    list: _lua_vector3,
+    tuple: _lua_vector3,
+}
+
+# Keyword -> (object type, default name); insertion order is match precedence
+_TYPE_MAP = {
+    'cube': ('cube', 'Cube'), 'cubes': ('cube', 'Cube'),
+    'block': ('cube', 'Cube'), 'blocks': ('cube', 'Cube'),
+    'sphere': ('sphere', 'Sphere'), 'spheres': ('sphere', 'Sphere'),
+    'ball': ('sphere', 'Sphere'), 'balls': ('sphere', 'Sphere'),
+    'cylinder': ('cylinder', 'Cylinder'), 'cylinders': ('cylinder', 'Cylinder'),
+    'folder': ('folder', 'Folder'), 'folders': ('folder', 'Folder'),
+    'model': ('model', 'Model'), 'models': ('model', 'Model'),
+}
+
+_COLOR_MAP = {
+    'red': 'Bright red',
+    'blue': 'Bright blue',
+    'green': 'Bright green',
+}
+
 def get_object_creation_script(object_type, name, properties=None):
     """Generate Lua script to create Roblox objects"""
     properties = properties or {}
@@ -15,106 +60,53 @@ def get_object_creation_script(object_type, name, properties=None):
     else:
         return generate_generic_instance_script(object_type, name, properties)
 
-def generate_part_script(name, properties):
-    """Generate script to create a Part (cube)"""
-    size = properties.get('size', [4, 4, 4])
-    position = properties.get('position', [0, 10, 0])
-    color = properties.get('color', None)
-    material = properties.get('material', 'Plastic')
-    parent = properties.get('parent', 'Workspace')
-    anchored = properties.get('anchored', True)
-    
-    size_str = f"Vector3.new({size[0]}, {size[1]}, {size[2]})"
-    pos_str = f"Vector3.new({position[0]}, {position[1]}, {position[2]})"
-    
-    color_line = ""
-    if color:
-        if isinstance(color, list) and len(color) == 3:
-            color_line = f"part.Color = Color3.new({color[0]}, {color[1]}, {color[2]})"
-        elif isinstance(color, str):
-            color_line = f"part.BrickColor = BrickColor.new('{color}')"
-    
-    script = f"""-- Auto-generated script to create {name}
+_PART_TMPL = """-- Auto-generated script to create {name}
 local part = Instance.new("Part")
 part.Name = "{name}"
-part.Size = {size_str}
-part.Position = {pos_str}
-part.Material = Enum.Material.{material}
-part.Anchored = {str(anchored).lower()}
-{color_line}
-part.Parent = game.{parent}
-
-print("✅ Created part: {name}")
-"""
-    return script.strip()
+part.Size = Vector3.new({sx}, {sy}, {sz})
+part.Position = Vector3.new({px}, {py}, {pz})
+{shape_line}part.Material = Enum.Material.{material}
+part.Anchored = {anchored}
+{color_line}part.Parent = game.{parent}
 
-def generate_sphere_script(name, properties):
-    """Generate script to create a Sphere"""
+print("✅ Created {kind}: {name}")"""
+
+def _generate_part(kind, shape_line, name, properties):
+    """Render the shared Part template; shape_line is '' or a full Lua line"""
     size = properties.get('size', [4, 4, 4])
     position = properties.get('position', [0, 10, 0])
     color = properties.get('color', None)
-    material = properties.get('material', 'Plastic')
-    parent = properties.get('parent', 'Workspace')
-    anchored = properties.get('anchored', True)
-    
-    size_str = f"Vector3.new({size[0]}, {size[1]}, {size[2]})"
-    pos_str = f"Vector3.new({position[0]}, {position[1]}, {position[2]})"
     
     color_line = ""
     if color:
         if isinstance(color, list) and len(color) == 3:
-            color_line = f"part.Color = Color3.new({color[0]}, {color[1]}, {color[2]})"
+            color_line = f"part.Color = Color3.new({color[0]}, {color[1]}, {color[2]})\n"
         elif isinstance(color, str):
-            color_line = f"part.BrickColor = BrickColor.new('{color}')"
-    
-    script = f"""-- Auto-generated script to create {name}
-local part = Instance.new("Part")
-part.Name = "{name}"
-part.Size = {size_str}
-part.Position = {pos_str}
-part.Shape = Enum.PartType.Ball
-part.Material = Enum.Material.{material}
-part.Anchored = {str(anchored).lower()}
-{color_line}
-part.Parent = game.{parent}
-
-print("✅ Created sphere: {name}")
-"""
-    return script.strip()
+            color_line = f"part.BrickColor = BrickColor.new('{color}')\n"
+    
+    return _PART_TMPL.format_map({
+        'kind': kind,
+        'name': name,
+        'sx': size[0], 'sy': size[1], 'sz': size[2],
+        'px': position[0], 'py': position[1], 'pz': position[2],
+        'shape_line': shape_line,
+        'material': properties.get('material', 'Plastic'),
+        'anchored': _lua_anchored(properties.get('anchored', True)),
+        'color_line': color_line,
+        'parent': properties.get('parent', 'Workspace'),
+    })
+
+def generate_part_script(name, properties):
+    """Generate script to create a Part (cube)"""
+    return _generate_part('part', '', name, properties)
+
+def generate_sphere_script(name, properties):
+    """Generate script to create a Sphere"""
+    return _generate_part('sphere', 'part.Shape = Enum.PartType.Ball\n', name, properties)
 
 def generate_cylinder_script(name, properties):
     """Generate script to create a Cylinder"""
-    size = properties.get('size', [4, 4, 4])
-    position = properties.get('position', [0, 10, 0])
-    color = properties.get('color', None)
-    material = properties.get('material', 'Plastic')
-    parent = properties.get('parent', 'Workspace')
-    anchored = properties.get('anchored', True)
-    
-    size_str = f"Vector3.new({size[0]}, {size[1]}, {size[2]})"
-    pos_str = f"Vector3.new({position[0]}, {position[1]}, {position[2]})"
-    
-    color_line = ""
-    if color:
-        if isinstance(color, list) and len(color) == 3:
-            color_line = f"part.Color = Color3.new({color[0]}, {color[1]}, {color[2]})"
-        elif isinstance(color, str):
-            color_line = f"part.BrickColor = BrickColor.new('{color}')"
-    
-    script = f"""-- Auto-generated script to create {name}
-local part = Instance.new("Part")
-part.Name = "{name}"
-part.Size = {size_str}
-part.Position = {pos_str}
-part.Shape = Enum.PartType.Cylinder
-part.Material = Enum.Material.{material}
-part.Anchored = {str(anchored).lower()}
-{color_line}
-part.Parent = game.{parent}
-
-print("✅ Created cylinder: {name}")
-"""
-    return script.strip()
+    return _generate_part('cylinder', 'part.Shape = Enum.PartType.Cylinder\n', name, properties)
 
 def generate_folder_script(name, properties):
     """Generate script to create a Folder"""
@@ -131,48 +123,37 @@ print("✅ Created folder: {name}")
 
 def generate_model_script(name, properties):
     """Generate script to create a Model"""
-    parent = properties.get('parent', 'Workspace')
+    # str() everything joined below, so non-str names/paths render as the f-string version did
+    name = str(name)
+    parent = str(properties.get('parent', 'Workspace'))
     primary_part = properties.get('primary_part', None)
     
-    primary_line = ""
+    parts = [
+        '-- Auto-generated script to create ', name,
+        '\nlocal model = Instance.new("Model")\nmodel.Name = "', name, '"\n',
+    ]
     if primary_part:
-        primary_line = f'model.PrimaryPart = model:FindFirstChild("{primary_part}")'
+        parts.extend(['model.PrimaryPart = model:FindFirstChild("', str(primary_part), '")\n'])
+    parts.extend(['model.Parent = game.', parent, '\n\nprint("✅ Created model: ', name, '")'])
     
-    script = f"""-- Auto-generated script to create {name}
-local model = Instance.new("Model")
-model.Name = "{name}"
-{primary_line}
-model.Parent = game.{parent}
-
-print("✅ Created model: {name}")
-"""
-    return script.strip()
+    return ''.join(parts)
 
 def generate_generic_instance_script(object_type, name, properties):
     """Generate script to create any Roblox Instance"""
-    parent = properties.get('parent', 'Workspace')
+    object_type, name = str(object_type), str(name)
+    parent = str(properties.get('parent', 'Workspace'))
     
-    properties_lines = []
+    parts = [
+        '-- Auto-generated script to create ', name,
+        '\nlocal instance = Instance.new("', object_type, '")\ninstance.Name = "', name, '"\n',
+    ]
     for key, value in properties.items():
-        if key not in ['parent']:
-            if isinstance(value, str):
-                properties_lines.append(f'instance.{key} = "{value}"')
-            elif isinstance(value, bool):
-                properties_lines.append(f'instance.{key} = {str(value).lower()}')
-            else:
-                properties_lines.append(f'instance.{key} = {value}')
-    
-    properties_str = '\n'.join(properties_lines)
+        if key != 'parent':
+            lua_value = _LUA_FMT.get(type(value), str)(value)
+            parts.extend(['instance.', str(key), ' = ', lua_value, '\n'])
+    parts.extend(['instance.Parent = game.', parent, '\n\nprint("✅ Created ', object_type, ': ', name, '")'])
     
-    script = f"""-- Auto-generated script to create {name}
-local instance = Instance.new("{object_type}")
-instance.Name = "{name}"
-{properties_str}
-instance.Parent = game.{parent}
-
-print("✅ Created {object_type}: {name}")
-"""
-    return script.strip()
+    return ''.join(parts)
 
 def parse_object_command(message):
     """Parse user message to extract object creation parameters"""
@@ -184,44 +165,33 @@ def parse_object_command(message):
         'properties': {}
     }
     
-    if 'cube' in message_lower or 'block' in message_lower:
-        result['type'] = 'cube'
-        result['name'] = 'Cube'
-    elif 'sphere' in message_lower or 'ball' in message_lower:
-        result['type'] = 'sphere'
-        result['name'] = 'Sphere'
-    elif 'cylinder' in message_lower:
-        result['type'] = 'cylinder'
-        result['name'] = 'Cylinder'
-    elif 'folder' in message_lower:
-        result['type'] = 'folder'
-        result['name'] = 'Folder'
-    elif 'model' in message_lower:
-        result['type'] = 'model'
-        result['name'] = 'Model'
-    
-    import re
-    
-    size_match = re.search(r'size\s+(\d+)\s*[,x]?\s*(\d+)\s*[,x]?\s*(\d+)', message_lower)
+    tokens = set(_WORD_RE.findall(message_lower))
+    
+    for keyword, (object_type, default_name) in _TYPE_MAP.items():
+        if keyword in tokens:
+            result['type'] = object_type
+            result['name'] = default_name
+            break
+    
+    size_match = _SIZE_RE.search(message_lower)
     if size_match:
         result['properties']['size'] = [int(size_match.group(1)), int(size_match.group(2)), int(size_match.group(3))]
     
-    pos_match = re.search(r'(?:position|pos|at)\s+(-?\d+)\s*[,]?\s*(-?\d+)\s*[,]?\s*(-?\d+)', message_lower)
+    pos_match = _POS_RE.search(message_lower)
     if pos_match:
         result['properties']['position'] = [int(pos_match.group(1)), int(pos_match.group(2)), int(pos_match.group(3))]
     
-    color_match = re.search(r'color\s+([a-z]+)', message_lower)
+    color_match = _COLOR_RE.search(message_lower)
     if color_match:
         result['properties']['color'] = color_match.group(1).capitalize()
     
-    if 'red' in message_lower and 'color' not in result['properties']:
-        result['properties']['color'] = 'Bright red'
-    elif 'blue' in message_lower and 'color' not in result['properties']:
-        result['properties']['color'] = 'Bright blue'
-    elif 'green' in message_lower and 'color' not in result['properties']:
-        result['properties']['color'] = 'Bright green'
+    if 'color' not in result['properties']:
+        for keyword, brick_color in _COLOR_MAP.items():
+            if keyword in tokens:
+                result['properties']['color'] = brick_color
+                break
     
-    name_match = re.search(r'(?:named|called)\s+["\']?([^"\']+)["\']?', message)
+    name_match = _NAME_RE.search(message)
     if name_match:
         result['name'] = name_match.group(1).strip()
     
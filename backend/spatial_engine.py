@@ -3,9 +3,38 @@ Spatial Reasoning Engine - Handles 3D positioning, CFrame calculations, and layo
 Solves the critical problem of objects spawning at the same location
 """
 
-import math
+from math import ceil, cos, pi, sin, sqrt
 from typing import List, Dict, Tuple, Any
 
+# Shared by every CFrame we emit; callers treat CFrame dicts as read-only
+_IDENTITY_ORIENTATION = (
+    (1.0, 0.0, 0.0),
+    (0.0, 1.0, 0.0),
+    (0.0, 0.0, 1.0)
+)
+
+# Obby difficulty settings; platform sizes are tuples so every platform can share one
+_OBBY_SETTINGS = {
+    'easy': {'x_spacing': 8, 'z_spacing': 0, 'y_variation': 2, 'platform_size': (8, 1, 8)},
+    'medium': {'x_spacing': 10, 'z_spacing': 2, 'y_variation': 3, 'platform_size': (6, 1, 6)},
+    'hard': {'x_spacing': 12, 'z_spacing': 4, 'y_variation': 4, 'platform_size': (4, 1, 4)}
+}
+
+_OBBY_COLORS = (
+    'Bright blue', 'Bright green', 'Bright yellow',
+    'Bright orange', 'Bright red', 'Bright violet'
+)
+
+# Shared house part fields; each part spreads these and adds its own
+_HOUSE_PART = {'className': 'Part', 'parent': 'Workspace'}
+_WALL_PROPS = {'BrickColor': 'Brick yellow', 'Material': 'Brick', 'Anchored': True}
+
+_TOWER_SIZES = {
+    'small': {'base': 8, 'floors': 5, 'floor_height': 4},
+    'medium': {'base': 12, 'floors': 8, 'floor_height': 5},
+    'large': {'base': 16, 'floors': 12, 'floor_height': 6}
+}
+
 class SpatialEngine:
     """Calculates proper 3D positions and CFrame values for Roblox objects"""
     
@@ -14,11 +43,7 @@ class SpatialEngine:
         """Convert Vector3 position to CFrame format for Roblox (Rojo v7 format)"""
         return {
             "position": [float(x), float(y), float(z)],
-            "orientation": [
-                [1.0, 0.0, 0.0],
-                [0.0, 1.0, 0.0],
-                [0.0, 0.0, 1.0]
-            ]
+            "orientation": _IDENTITY_ORIENTATION
         }
     
     @staticmethod
@@ -33,16 +58,29 @@ class SpatialEngine:
         Returns:
             List of platform configurations with CFrame positions
         """
-        platforms = []
+        return SpatialEngine.platforms_aos(
+            SpatialEngine.calculate_obby_platforms_soa(num_platforms, difficulty)
+        )
+    
+    @staticmethod
+    def calculate_obby_platforms_soa(num_platforms, difficulty='medium'):
+        """
+        Same layout as calculate_obby_platforms, as parallel arrays
         
-        # Difficulty settings
-        settings = {
-            'easy': {'x_spacing': 8, 'z_spacing': 0, 'y_variation': 2, 'platform_size': [8, 1, 8]},
-            'medium': {'x_spacing': 10, 'z_spacing': 2, 'y_variation': 3, 'platform_size': [6, 1, 6]},
-            'hard': {'x_spacing': 12, 'z_spacing': 4, 'y_variation': 4, 'platform_size': [4, 1, 4]}
-        }
+        Returns:
+            Dict with 'names', 'positions' ((x, y, z) tuples), 'colors' and
+            'size' (one Size shared by every platform)
+        """
+        config = _OBBY_SETTINGS.get(difficulty, _OBBY_SETTINGS['medium'])
+        x_spacing = config['x_spacing']
+        z_spacing = config['z_spacing']
+        y_variation = config['y_variation']
+        
+        # Per-step deltas repeat with i % 2 (zig-zag) and i % 3 (height)
+        z_deltas = (-z_spacing, z_spacing)
+        y_deltas = (y_variation, -(y_variation // 2), 0)
         
-        config = settings.get(difficulty, settings['medium'])
+        positions = [None] * num_platforms
         
         # Starting position
         current_x = 0
@@ -52,38 +90,44 @@ class SpatialEngine:
         for i in range(num_platforms):
             # Calculate position with variation
             if i > 0:
-                current_x += config['x_spacing']
-                current_z += (-1 if i % 2 == 0 else 1) * config['z_spacing']
-                
-                # Add height variation
-                if i % 3 == 0:
-                    current_y += config['y_variation']
-                elif i % 3 == 1:
-                    current_y -= config['y_variation'] // 2
-            
-            platforms.append({
-                'name': f'Platform{i + 1}',
+                current_x += x_spacing
+                current_z += z_deltas[i % 2]
+                current_y += y_deltas[i % 3]
+            positions[i] = (current_x, current_y, current_z)
+        
+        return {
+            'names': [f'Platform{i + 1}' for i in range(num_platforms)],
+            'positions': positions,
+            'colors': [_OBBY_COLORS[i % len(_OBBY_COLORS)] for i in range(num_platforms)],
+            'size': config['platform_size']
+        }
+    
+    @staticmethod
+    def platforms_aos(soa):
+        """Materialize the per-platform part dicts MCP expects from an SoA layout"""
+        to_cframe = SpatialEngine.vector3_to_cframe
+        size = soa['size']
+        
+        return [
+            {
+                'name': name,
                 'className': 'Part',
                 'parent': 'game.Workspace',
                 'properties': {
-                    'CFrame': SpatialEngine.vector3_to_cframe(current_x, current_y, current_z),
-                    'Size': config['platform_size'],
-                    'BrickColor': SpatialEngine.get_obby_color(i),
+                    'CFrame': to_cframe(x, y, z),
+                    'Size': size,
+                    'BrickColor': color,
                     'Material': 'Plastic',
                     'Anchored': True
                 }
-            })
-        
-        return platforms
+            }
+            for name, (x, y, z), color in zip(soa['names'], soa['positions'], soa['colors'])
+        ]
     
     @staticmethod
     def get_obby_color(index):
         """Get color for obby platform based on index"""
-        colors = [
-            'Bright blue', 'Bright green', 'Bright yellow', 
-            'Bright orange', 'Bright red', 'Bright violet'
-        ]
-        return colors[index % len(colors)]
+        return _OBBY_COLORS[index % len(_OBBY_COLORS)]
     
     @staticmethod
     def calculate_grid_layout(num_objects, object_size, spacing=2):
@@ -98,23 +142,18 @@ class SpatialEngine:
         Returns:
             List of CFrame positions
         """
-        positions = []
-        grid_size = math.ceil(math.sqrt(num_objects))
+        grid_size = ceil(sqrt(num_objects))
         
         x_step = object_size[0] + spacing
         z_step = object_size[2] + spacing
+        y = object_size[1] / 2
+        to_cframe = SpatialEngine.vector3_to_cframe
         
-        for i in range(num_objects):
-            row = i // grid_size
-            col = i % grid_size
-            
-            x = col * x_step
-            y = object_size[1] / 2
-            z = row * z_step
-            
-            positions.append(SpatialEngine.vector3_to_cframe(x, y, z))
-        
-        return positions
+        # row = i // grid_size, col = i % grid_size
+        return [
+            to_cframe(col * x_step, y, row * z_step)
+            for row, col in (divmod(i, grid_size) for i in range(num_objects))
+        ]
     
     @staticmethod
     def calculate_circular_layout(num_objects, radius=20, height=5):
@@ -129,17 +168,15 @@ class SpatialEngine:
         Returns:
             List of CFrame positions
         """
-        positions = []
-        angle_step = (2 * math.pi) / num_objects
+        to_cframe = SpatialEngine.vector3_to_cframe
         
-        for i in range(num_objects):
-            angle = i * angle_step
-            x = radius * math.cos(angle)
-            z = radius * math.sin(angle)
-            
-            positions.append(SpatialEngine.vector3_to_cframe(x, height, z))
+        angle_step = (2 * pi) / num_objects
+        angles = [i * angle_step for i in range(num_objects)]
         
-        return positions
+        return [
+            to_cframe(radius * cos(angle), height, radius * sin(angle))
+            for angle in angles
+        ]
     
     @staticmethod
     def calculate_staircase(num_steps, step_size=[10, 1, 4], rise=1, run=4):
@@ -214,8 +251,7 @@ class SpatialEngine:
         # Floor
         objects.append({
             'name': 'HouseFloor',
-            'className': 'Part',
-            'parent': 'Workspace',
+            **_HOUSE_PART,
             'properties': {
                 'CFrame': SpatialEngine.vector3_to_cframe(0, 0.5, 0),
                 'Size': [base_size[0], 1, base_size[2]],
@@ -232,56 +268,44 @@ class SpatialEngine:
         # Front wall
         objects.append({
             'name': 'HouseFrontWall',
-            'className': 'Part',
-            'parent': 'Workspace',
+            **_HOUSE_PART,
             'properties': {
+                **_WALL_PROPS,
                 'CFrame': SpatialEngine.vector3_to_cframe(0, wall_height/2, -base_size[2]/2),
-                'Size': [base_size[0], wall_height, wall_thickness],
-                'BrickColor': 'Brick yellow',
-                'Material': 'Brick',
-                'Anchored': True
+                'Size': [base_size[0], wall_height, wall_thickness]
             }
         })
         
         # Back wall
         objects.append({
             'name': 'HouseBackWall',
-            'className': 'Part',
-            'parent': 'Workspace',
+            **_HOUSE_PART,
             'properties': {
+                **_WALL_PROPS,
                 'CFrame': SpatialEngine.vector3_to_cframe(0, wall_height/2, base_size[2]/2),
-                'Size': [base_size[0], wall_height, wall_thickness],
-                'BrickColor': 'Brick yellow',
-                'Material': 'Brick',
-                'Anchored': True
+                'Size': [base_size[0], wall_height, wall_thickness]
             }
         })
         
         # Left wall
         objects.append({
             'name': 'HouseLeftWall',
-            'className': 'Part',
-            'parent': 'Workspace',
+            **_HOUSE_PART,
             'properties': {
+                **_WALL_PROPS,
                 'CFrame': SpatialEngine.vector3_to_cframe(-base_size[0]/2, wall_height/2, 0),
-                'Size': [wall_thickness, wall_height, base_size[2]],
-                'BrickColor': 'Brick yellow',
-                'Material': 'Brick',
-                'Anchored': True
+                'Size': [wall_thickness, wall_height, base_size[2]]
             }
         })
         
         # Right wall
         objects.append({
             'name': 'HouseRightWall',
-            'className': 'Part',
-            'parent': 'Workspace',
+            **_HOUSE_PART,
             'properties': {
+                **_WALL_PROPS,
                 'CFrame': SpatialEngine.vector3_to_cframe(base_size[0]/2, wall_height/2, 0),
-                'Size': [wall_thickness, wall_height, base_size[2]],
-                'BrickColor': 'Brick yellow',
-                'Material': 'Brick',
-                'Anchored': True
+                'Size': [wall_thickness, wall_height, base_size[2]]
             }
         })
         
@@ -304,12 +328,7 @@ class SpatialEngine:
     @staticmethod
     def _create_tower(size):
         """Create a simple tower structure"""
-        sizes = {
-            'small': {'base': 8, 'floors': 5, 'floor_height': 4},
-            'medium': {'base': 12, 'floors': 8, 'floor_height': 5},
-            'large': {'base': 16, 'floors': 12, 'floor_height': 6}
-        }
-        config = sizes.get(size, sizes['medium'])
+        config = _TOWER_SIZES.get(size, _TOWER_SIZES['medium'])
         
         objects = []
         
@@ -351,24 +370,26 @@ class SpatialEngine:
         Returns:
             List of CFrame positions along the path
         """
-        positions = []
+        if num_points > 1:
+            ts = [i / (num_points - 1) for i in range(num_points)]
+        else:
+            ts = [0] * num_points
         
-        for i in range(num_points):
-            t = i / (num_points - 1) if num_points > 1 else 0
-            
-            x = start_pos[0] + (end_pos[0] - start_pos[0]) * t
-            y = start_pos[1] + (end_pos[1] - start_pos[1]) * t
-            z = start_pos[2] + (end_pos[2] - start_pos[2]) * t
-            
-            # Add curve if specified
-            if curve_amount > 0:
-                # Parabolic curve
-                curve_offset = curve_amount * math.sin(t * math.pi)
-                y += curve_offset
-            
-            positions.append(SpatialEngine.vector3_to_cframe(x, y, z))
+        dx = end_pos[0] - start_pos[0]
+        dy = end_pos[1] - start_pos[1]
+        dz = end_pos[2] - start_pos[2]
+        
+        xs = [start_pos[0] + dx * t for t in ts]
+        ys = [start_pos[1] + dy * t for t in ts]
+        zs = [start_pos[2] + dz * t for t in ts]
         
-        return positions
+        # Add curve if specified
+        if curve_amount > 0:
+            # Parabolic curve
+            ys = [y + curve_amount * sin(t * pi) for y, t in zip(ys, ts)]
+        
+        to_cframe = SpatialEngine.vector3_to_cframe
+        return [to_cframe(x, y, z) for x, y, z in zip(xs, ys, zs)]
     
     @staticmethod
     def get_spawn_location(platform_cframe, platform_size):
@@ -390,8 +411,13 @@ class SpatialEngine:
             # Fallback for old format
             x, y, z = platform_cframe[0], platform_cframe[1], platform_cframe[2]
         
+        return SpatialEngine.spawn_above(x, y, z, platform_size[1])
+    
+    @staticmethod
+    def spawn_above(x, y, z, platform_size_y):
+        """Spawn CFrame above a platform centred at (x, y, z), skipping CFrame dict unpacking"""
         return SpatialEngine.vector3_to_cframe(
             x,
-            y + platform_size[1]/2 + 2.5,  # 2.5 studs above platform
+            y + platform_size_y/2 + 2.5,  # 2.5 studs above platform
             z
         )